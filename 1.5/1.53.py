@@ -1,23 +1,26 @@
 import os
+import json
 import re
 import zlib
+import functools
 import unicodedata
 import sys
 
-# 5-bit Baudot (ITA2 Letters Mode)
-BAUDOT_TABLE = {
-    'a': '00011','b': '11001','c': '01110','d': '01001',
-    'e': '00001','f': '01101','g': '11010','h': '10100',
-    'i': '00110','j': '01011','k': '01111','l': '10010',
-    'm': '11100','n': '01100','o': '11000','p': '10110',
-    'q': '10111','r': '01010','s': '00101','t': '10000',
-    'u': '00111','v': '11110','w': '10011','x': '11101',
-    'y': '10101','z': '10001',' ': '00100',
-    '1': '00010','2': '11011','3': '11111'
-}
-
-REVERSE_TABLE = {v: k for k, v in BAUDOT_TABLE.items()}
-STOP_WORD = "stop"
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+# The encoder/decoder lives in baudot_core.py in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from baudot_core import BAUDOT_TABLE, BAUDOT_LUT, STOP_WORD, encode, decode_stream
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+DECODE_CHUNK_SIZE = 64 * 1024
+
+# Anything other than a newline or visible ASCII needs a Unicode diagnostic
+_TEXT_BAD_RE = re.compile(r"[^\n\x20-\x7e]")
+_FNAME_RE = re.compile(r"[A-Za-z0-9_-]+")
 
 # =============================
 # LOAD SHORTCUTS FROM abv.txt
@@ -27,7 +30,27 @@ def load_shortcuts(filename="abv.txt"):
         print("ERROR: abv.txt not found in program directory.")
         return {}
 
+    # Reuse the parse from the last run while abv.txt is unchanged
+    # (JSON rather than pickle: loading it can never run code, and any damage
+    # just means a cache miss)
+    cache_filename = os.path.splitext(filename)[0] + ".cache.json"
+    mtime = os.stat(filename).st_mtime_ns
+    try:
+        with open(cache_filename, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError, RecursionError):
+        cached = None
+    if (
+        isinstance(cached, dict)
+        and cached.get("mtime") == mtime
+        and isinstance(cached.get("data"), dict)
+        and all(isinstance(k, str) and isinstance(v, str) for k, v in cached["data"].items())
+    ):
+        # Loaded strings are not interned, so re-intern them
+        return {sys.intern(k): sys.intern(v) for k, v in cached["data"].items()}
+
     shortcuts = {}
+    used_shorts = set()
     allowed_chars = set(BAUDOT_TABLE.keys())
 
     with open(filename, "r", encoding="utf-8") as f:
@@ -42,8 +65,8 @@ def load_shortcuts(filename="abv.txt"):
                 continue
 
             full, short = line.split("=", 1)
-            full = full.strip().replace(" ", "")
-            short = short.strip().replace(" ", "")
+            full = sys.intern(full.strip().replace(" ", ""))
+            short = sys.intern(short.strip().replace(" ", ""))
 
             if not full.islower() or not short.islower():
                 print(f"Line {line_number}: Only lowercase words allowed.")
@@ -61,11 +84,20 @@ def load_shortcuts(filename="abv.txt"):
                 print(f"Duplicate full word on line {line_number}.")
                 continue
 
-            if short in shortcuts.values():
+            if short in used_shorts:
                 print(f"Duplicate shortcut on line {line_number}.")
                 continue
 
             shortcuts[full] = short
+            used_shorts.add(short)
+
+    # Write to a temp file and swap it in so a crash never leaves a torn cache
+    try:
+        with open(cache_filename + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"mtime": mtime, "data": shortcuts}, f)
+        os.replace(cache_filename + ".tmp", cache_filename)
+    except OSError:
+        pass
 
     return shortcuts
 
@@ -83,10 +115,17 @@ def read_text_file(filename):
     with open(filename, "r", encoding="utf-8") as f:
         text = f.read()
 
+    # Clean files skip the per-character diagnostics entirely
+    first_bad = _TEXT_BAD_RE.search(text)
+    if first_bad is None:
+        return text
+
     unicode_errors = []
-    line, column = 1, 1
+    start = first_bad.start()
+    line = text.count("\n", 0, start) + 1
+    column = start - text.rfind("\n", 0, start)
 
-    for char in text:
+    for char in text[start:]:
         if char == "\n":
             line += 1
             column = 1
@@ -120,27 +159,31 @@ def read_text_file(filename):
 # =============================
 # CORE FUNCTIONS
 # =============================
-def bits_to_bytes(bitstring):
-    while len(bitstring) % 8 != 0:
-        bitstring += "0"
-    byte_array = bytearray()
-    for i in range(0, len(bitstring), 8):
-        byte_array.append(int(bitstring[i:i+8], 2))
-    return byte_array
+# Shortcut tables are fixed after load_shortcuts(), so per-word results can be memoized
+@functools.lru_cache(maxsize=4096)
+def _encode_word(word):
+    return WORD_SHORTCUTS.get(word, word)
 
-def bytes_to_bits(byte_data):
-    return ''.join(f'{byte:08b}' for byte in byte_data)
+@functools.lru_cache(maxsize=4096)
+def _decode_word(word):
+    return REVERSE_SHORTCUTS.get(word, word)
 
 def apply_shortcuts_encode(message):
-    words = message.split()
-    return " ".join(WORD_SHORTCUTS.get(word, word) for word in words)
+    return " ".join(map(_encode_word, map(sys.intern, message.split())))
 
 def apply_shortcuts_decode(message):
-    words = message.split()
-    return " ".join(REVERSE_SHORTCUTS.get(word, word) for word in words)
+    return " ".join(map(_decode_word, map(sys.intern, message.split())))
 
 def validate_message(message):
+    # One C-level translate through BAUDOT_LUT with newlines dropped; anything
+    # left mapping to 0xFF (including uppercase) is an error. The per-character
+    # walk below only runs when there is something to report.
+    raw = message.encode("ascii", errors="replace")
+    if 0xFF not in raw.translate(BAUDOT_LUT, b"\n"):
+        return []
     errors = []
+    add_error = errors.append
+    in_table = BAUDOT_TABLE.__contains__
     line, column = 1, 1
     for char in message:
         if char == "\n":
@@ -148,9 +191,9 @@ def validate_message(message):
             column = 1
             continue
         if char.isupper():
-            errors.append((line, column, char, "Uppercase character not allowed"))
-        elif char not in BAUDOT_TABLE:
-            errors.append((line, column, char, "Invalid character"))
+            add_error((line, column, char, "Uppercase character not allowed"))
+        elif not in_table(char):
+            add_error((line, column, char, "Invalid character"))
         column += 1
     return errors
 
@@ -161,18 +204,16 @@ def validate_output_filename(name):
     if "." in name:
         print("Error: Do NOT include '.' or '.bin' in the file name.")
         return False
-    if not re.fullmatch(r"[A-Za-z0-9_-]+", name):
+    if not _FNAME_RE.fullmatch(name):
         print("Error: File name may only contain letters, numbers, underscores, and hyphens.")
         return False
     return True
 
-def build_encoded_bytes(message):
-    bitstring = ""
-    for char in message:
-        bitstring += BAUDOT_TABLE[char]
-    for char in STOP_WORD:
-        bitstring += BAUDOT_TABLE[char]
-    return bits_to_bytes(bitstring)
+def compress_bytes(byte_data, use_zstd=False):
+    # zlib by default so any Python can read the file back; zstd only on request
+    if use_zstd:
+        return zstd.ZstdCompressor(level=3).compress(byte_data)
+    return zlib.compress(byte_data)
 
 def handle_compression(byte_data, final_filename):
     use_compression = input("Apply lossless compression? (y/n): ").strip().lower()
@@ -181,8 +222,11 @@ def handle_compression(byte_data, final_filename):
             f.write(byte_data)
         print("Saved uncompressed.")
         return
+    use_zstd = False
+    if zstd is not None:
+        use_zstd = input("Use zstd instead of zlib? (needs zstandard to decode) (y/n): ").strip().lower() == "y"
     compare = input("Check if compressed file is larger before saving? (y/n): ").strip().lower()
-    compressed_data = zlib.compress(byte_data)
+    compressed_data = compress_bytes(byte_data, use_zstd)
     if compare == "y" and len(compressed_data) > len(byte_data):
         print("Compressed file is larger than uncompressed.")
         choice = input("Save compressed anyway? (y = compressed / n = uncompressed): ").strip().lower()
@@ -206,45 +250,80 @@ def encode_to_file_from_text(txt_filename, output_filename):
             print(f"Line {err[0]}, Column {err[1]} | Character: '{err[2]}' | Cause: {err[3]}")
         print("\nReturning to main menu.\n")
         return
-    byte_data = build_encoded_bytes(message)
+    byte_data = encode(message)
     handle_compression(byte_data, output_filename)
     print(f"\nSaved to: {os.path.abspath(output_filename)}\n")
 
+def read_chunks(f, decompress=None):
+    while True:
+        chunk = f.read(DECODE_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield decompress(chunk) if decompress else chunk
+
+def find_stop(parts):
+    # Decoded bytes before the first stop word, or None; stops reading at the match
+    stop_bytes = STOP_WORD.encode("ascii")
+    decoded = bytearray()
+    for part in parts:
+        # Only the new text plus a possible partial match before it needs scanning
+        start = max(0, len(decoded) - len(stop_bytes) + 1)
+        decoded += part
+        idx = decoded.find(stop_bytes, start)
+        if idx >= 0:
+            return decoded[:idx]
+    return None
+
 def decode_from_file(filename):
     if not os.path.exists(filename):
         print("File not found.")
         return
     with open(filename, "rb") as f:
-        byte_data = f.read()
-    try:
-        byte_data = zlib.decompress(byte_data)
-    except:
-        pass
-    bitstring = bytes_to_bits(byte_data)
-    decoded = ""
-    stop_buffer = ""
-    for i in range(0, len(bitstring), 5):
-        chunk = bitstring[i:i+5]
-        if len(chunk) < 5:
-            break
-        if chunk not in REVERSE_TABLE:
-            continue
-        char = REVERSE_TABLE[chunk]
-        decoded += char
-        stop_buffer += char
-        if len(stop_buffer) > len(STOP_WORD):
-            stop_buffer = stop_buffer[-len(STOP_WORD):]
-        if stop_buffer == STOP_WORD:
-            decoded_message = decoded[:-len(STOP_WORD)]
-            decoded_message = apply_shortcuts_decode(decoded_message)
-            print("\nDecoded message:")
-            print(decoded_message)
-            return
-    print("Stop word not found.")
+        head = f.read(4)
+        f.seek(0)
+        decoded = None
+        decompressor = None
+        complete = False
+        is_zstd = head == ZSTD_MAGIC
+        if is_zstd and zstd is not None:
+            decompressor = zstd.ZstdDecompressor().decompressobj()
+            errors = zstd.ZstdError
+        elif len(head) >= 2 and head[0] == 0x78 and ((head[0] << 8) | head[1]) % 31 == 0:
+            decompressor = zlib.decompressobj()
+            errors = zlib.error
+        if decompressor is not None:
+            try:
+                decoded = find_stop(decode_stream(read_chunks(f, decompressor.decompress)))
+                complete = getattr(decompressor, "eof", False)
+            except errors:
+                pass
+        if decoded is None and not complete:
+            # Not a complete compressed stream: raw Baudot output can start with
+            # a zlib header or the zstd magic by chance, so decode the file as-is
+            f.seek(0)
+            decoded = find_stop(decode_stream(read_chunks(f)))
+    if decoded is None and is_zstd and not complete:
+        if zstd is None:
+            print("File is zstd-compressed but the zstandard module is not installed.")
+        else:
+            print("Compressed data is corrupt.")
+        return
+    if decoded is None:
+        print("Stop word not found.")
+        return
+    decoded_message = apply_shortcuts_decode(decoded.decode("ascii"))
+    print("\nDecoded message:")
+    print(decoded_message)
 
 # =============================
 # SUBMENU HANDLER
 # =============================
+def shut_down():
+    print("Shutting down program...")
+    sys.exit()
+
+_SUBMENU_ACTIONS = {"1": lambda: True, "2": lambda: False, "3": shut_down}
+
 def submenu(action_type):
     while True:
         print(f"\n--- {action_type} Submenu ---")
@@ -252,19 +331,44 @@ def submenu(action_type):
         print("2 = Return to main menu")
         print("3 = Exit program immediately")
         choice = input("Choose option: ").strip()
-        if choice == "1":
-            return True
-        elif choice == "2":
-            return False
-        elif choice == "3":
-            print("Shutting down program...")
-            sys.exit()
-        else:
+        action = _SUBMENU_ACTIONS.get(choice)
+        if action is None:
             print("Invalid option. Choose 1, 2, or 3.")
+            continue
+        return action()
 
 # =============================
 # MAIN LOOP
 # =============================
+# Menu actions return True when the program should exit
+def encode_menu():
+    if not submenu("Encode"):
+        return False
+    txt_filename = input("Enter input .txt file name: ").strip()
+    if not txt_filename.endswith(".txt"):
+        txt_filename += ".txt"
+    output_name = input("Enter output file name (no extension): ").strip()
+    if not validate_output_filename(output_name):
+        return False
+    output_filename = output_name + ".bin"
+    encode_to_file_from_text(txt_filename, output_filename)
+    return False
+
+def decode_menu():
+    if not submenu("Decode"):
+        return False
+    filename = input("Enter .bin file name to decode: ").strip()
+    if not filename.endswith(".bin"):
+        filename += ".bin"
+    decode_from_file(filename)
+    return False
+
+def exit_menu():
+    print("Exiting program.")
+    return True
+
+_MAIN_ACTIONS = {"1": encode_menu, "2": decode_menu, "3": exit_menu}
+
 def main():
     while True:
         print("\n=== BAUDOT ENCODER / DECODER ===")
@@ -273,32 +377,12 @@ def main():
         print("3 = Exit")
         choice = input("Choose option: ").strip()
 
-        if choice == "1":
-            if not submenu("Encode"):
-                continue
-            txt_filename = input("Enter input .txt file name: ").strip()
-            if not txt_filename.endswith(".txt"):
-                txt_filename += ".txt"
-            output_name = input("Enter output file name (no extension): ").strip()
-            if not validate_output_filename(output_name):
-                continue
-            output_filename = output_name + ".bin"
-            encode_to_file_from_text(txt_filename, output_filename)
-
-        elif choice == "2":
-            if not submenu("Decode"):
-                continue
-            filename = input("Enter .bin file name to decode: ").strip()
-            if not filename.endswith(".bin"):
-                filename += ".bin"
-            decode_from_file(filename)
-
-        elif choice == "3":
-            print("Exiting program.")
-            break
-
-        else:
+        action = _MAIN_ACTIONS.get(choice)
+        if action is None:
             print("Invalid option. Please choose 1, 2, or 3.")
+            continue
+        if action():
+            break
 
 if __name__ == "__main__":
     main()
@@ -1,20 +1,6 @@
 import os
 
-# 5-bit Baudot (ITA2 Letters Mode)
-BAUDOT_TABLE = {
-    'a': '00011','b': '11001','c': '01110','d': '01001',
-    'e': '00001','f': '01101','g': '11010','h': '10100',
-    'i': '00110','j': '01011','k': '01111','l': '10010',
-    'm': '11100','n': '01100','o': '11000','p': '10110',
-    'q': '10111','r': '01010','s': '00101','t': '10000',
-    'u': '00111','v': '11110','w': '10011','x': '11101',
-    'y': '10101','z': '10001',' ': '00100',
-    '1': '00010','2': '11011','3': '11111'
-}
-
-REVERSE_TABLE = {v: k for k, v in BAUDOT_TABLE.items()}
-
-STOP_WORD = "stop"
+from baudot_core import BAUDOT_TABLE, encode, decode
 
 # 🔹 Word compression dictionary
 WORD_SHORTCUTS = {
@@ -24,22 +10,6 @@ WORD_SHORTCUTS = {
 REVERSE_SHORTCUTS = {v: k for k, v in WORD_SHORTCUTS.items()}
 
 
-def bits_to_bytes(bitstring):
-    while len(bitstring) % 8 != 0:
-        bitstring += "0"
-
-    byte_array = bytearray()
-    for i in range(0, len(bitstring), 8):
-        byte = bitstring[i:i+8]
-        byte_array.append(int(byte, 2))
-
-    return byte_array
-
-
-def bytes_to_bits(byte_data):
-    return ''.join(f'{byte:08b}' for byte in byte_data)
-
-
 def apply_shortcuts_encode(message):
     words = message.split()
     return " ".join(WORD_SHORTCUTS.get(word, word) for word in words)
@@ -63,8 +33,6 @@ def validate_message(message):
 
 
 def encode_to_file(message, filename):
-    bitstring = ""
-
     message = apply_shortcuts_encode(message)
 
     while True:
@@ -83,13 +51,7 @@ def encode_to_file(message, filename):
         message = input("Please re-enter text using lowercase letters only: ")
         message = apply_shortcuts_encode(message)
 
-    for char in message:
-        bitstring += BAUDOT_TABLE[char]
-
-    for char in STOP_WORD:
-        bitstring += BAUDOT_TABLE[char]
-
-    byte_data = bits_to_bytes(bitstring)
+    byte_data = encode(message)
 
     with open(filename, "wb") as f:
         f.write(byte_data)
@@ -105,35 +67,16 @@ def decode_from_file(filename):
     with open(filename, "rb") as f:
         byte_data = f.read()
 
-    bitstring = bytes_to_bits(byte_data)
-
-    decoded = ""
-    stop_buffer = ""
-
-    for i in range(0, len(bitstring), 5):
-        chunk = bitstring[i:i+5]
-        if len(chunk) < 5:
-            break
+    decoded = decode(byte_data)
 
-        if chunk not in REVERSE_TABLE:
-            continue
-
-        char = REVERSE_TABLE[chunk]
-        decoded += char
-        stop_buffer += char
-
-        if len(stop_buffer) > len(STOP_WORD):
-            stop_buffer = stop_buffer[-len(STOP_WORD):]
-
-        if stop_buffer == STOP_WORD:
-            decoded_message = decoded[:-len(STOP_WORD)]
-            decoded_message = apply_shortcuts_decode(decoded_message)
+    if decoded is None:
+        print("Stop word not found.")
+        return
 
-            print("\nDecoded message:")
-            print(decoded_message)
-            return
+    decoded_message = apply_shortcuts_decode(decoded)
 
-    print("Stop word not found.")
+    print("\nDecoded message:")
+    print(decoded_message)
 
 
 def main():
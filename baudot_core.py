@@ -0,0 +1,169 @@
+# Shared 5-bit Baudot encoder/decoder used by the CLI scripts.
+# Fast paths are picked at import: the Cython kernel (baudot_kernel.pyx),
+# then Numba, then NumPy, then pure Python. All produce identical output.
+
+try:
+    import baudot_kernel
+except ImportError:
+    baudot_kernel = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba as nb
+except ImportError:
+    nb = None
+
+# 5-bit Baudot (ITA2 Letters Mode)
+BAUDOT_TABLE = {
+    'a': '00011','b': '11001','c': '01110','d': '01001',
+    'e': '00001','f': '01101','g': '11010','h': '10100',
+    'i': '00110','j': '01011','k': '01111','l': '10010',
+    'm': '11100','n': '01100','o': '11000','p': '10110',
+    'q': '10111','r': '01010','s': '00101','t': '10000',
+    'u': '00111','v': '11110','w': '10011','x': '11101',
+    'y': '10101','z': '10001',' ': '00100',
+    '1': '00010','2': '11011','3': '11111'
+}
+
+REVERSE_TABLE = {v: k for k, v in BAUDOT_TABLE.items()}
+STOP_WORD = "stop"
+
+# ord(char) -> 5-bit code as an int, 0xFF marks bytes with no Baudot code
+BAUDOT_LUT = bytearray(b"\xff" * 256)
+# 5-bit code -> ord(char), 0 marks the codes with no letter assigned
+REVERSE_BYTES = bytearray(32)
+for _char, _bits in BAUDOT_TABLE.items():
+    BAUDOT_LUT[ord(_char)] = int(_bits, 2)
+    REVERSE_BYTES[int(_bits, 2)] = ord(_char)
+del _char, _bits
+
+REVERSE_LUT_NP = None
+if np is not None:
+    REVERSE_LUT_NP = np.frombuffer(bytes(REVERSE_BYTES), dtype=np.uint8)
+
+if nb is not None:
+    # Native versions of the pure-Python pack/unpack loops below
+    @nb.njit(cache=True)
+    def _encode_kernel(codes, out):
+        acc = 0
+        nbits = 0
+        pos = 0
+        for i in range(codes.size):
+            acc = ((acc << 5) | codes[i]) & 0xFFF
+            nbits += 5
+            if nbits >= 8:
+                nbits -= 8
+                out[pos] = (acc >> nbits) & 0xFF
+                pos += 1
+        if nbits:
+            out[pos] = (acc << (8 - nbits)) & 0xFF
+            pos += 1
+        return pos
+
+    @nb.njit(cache=True)
+    def _decode_kernel(data, rev, out, acc, nbits):
+        pos = 0
+        for i in range(data.size):
+            acc = ((acc << 8) | data[i]) & 0xFFF
+            nbits += 8
+            while nbits >= 5:
+                nbits -= 5
+                c = rev[(acc >> nbits) & 0x1F]
+                if c:
+                    out[pos] = c
+                    pos += 1
+        return pos, acc, nbits
+
+
+def encode(message):
+    # One C-level translate maps every character to its 5-bit code and leaves
+    # the 0xFF sentinel on anything without one (non-ASCII becomes "?" first)
+    codes = (message + STOP_WORD).encode("ascii", errors="replace").translate(BAUDOT_LUT)
+    if 0xFF in codes:
+        raise ValueError(f"Invalid character: {message[codes.index(0xFF)]}")
+    if baudot_kernel is not None:
+        return baudot_kernel.encode(codes)
+    if nb is not None:
+        arr = np.frombuffer(codes, dtype=np.uint8)
+        out = np.empty((arr.size * 5 + 7) // 8, dtype=np.uint8)
+        return out[:_encode_kernel(arr, out)].tobytes()
+    if np is not None:
+        # Keep the low 5 bits of each code and repack in C
+        bits = np.unpackbits(np.frombuffer(codes, dtype=np.uint8)[:, None], axis=1)[:, 3:]
+        return np.packbits(bits.ravel()).tobytes()
+    # Pack 5-bit codes MSB-first through an int accumulator, flushing whole bytes
+    acc = 0
+    nbits = 0
+    out = bytearray()
+    append = out.append
+    for code in codes:
+        acc = ((acc << 5) | code) & 0xFFF
+        nbits += 5
+        if nbits >= 8:
+            nbits -= 8
+            append((acc >> nbits) & 0xFF)
+    if nbits:
+        append((acc << (8 - nbits)) & 0xFF)
+    return bytes(out)
+
+
+def decode_stream(chunks):
+    # Yield the decoded ASCII bytes for each input chunk; bits that do not
+    # fill a whole 5-bit code carry over into the next chunk
+    if baudot_kernel is not None:
+        acc = 0
+        nbits = 0
+        for chunk in chunks:
+            part, acc, nbits = baudot_kernel.decode(chunk, REVERSE_BYTES, acc, nbits)
+            yield part
+        return
+    if nb is not None:
+        acc = 0
+        nbits = 0
+        for chunk in chunks:
+            data = np.frombuffer(chunk, dtype=np.uint8)
+            out = np.empty((data.size * 8 + nbits) // 5, dtype=np.uint8)
+            pos, acc, nbits = _decode_kernel(data, REVERSE_LUT_NP, out, acc, nbits)
+            yield out[:pos].tobytes()
+        return
+    if np is not None:
+        carry = np.empty(0, dtype=np.uint8)
+        for chunk in chunks:
+            bits = np.concatenate((carry, np.unpackbits(np.frombuffer(chunk, dtype=np.uint8))))
+            n5 = bits.size - bits.size % 5
+            carry = bits[n5:]
+            codes = np.packbits(bits[:n5].reshape(-1, 5), axis=1).ravel() >> 3
+            chars = REVERSE_LUT_NP[codes]
+            yield chars[chars != 0].tobytes()
+        return
+    # Slide an int window over the bytes, peeling off 5-bit codes MSB-first
+    # into a buffer sized for the most codes the chunk can hold
+    rev = REVERSE_BYTES
+    acc = 0
+    nbits = 0
+    for chunk in chunks:
+        out = bytearray((len(chunk) * 8 + nbits) // 5)
+        pos = 0
+        for b in chunk:
+            acc = ((acc << 8) | b) & 0xFFF
+            nbits += 8
+            while nbits >= 5:
+                nbits -= 5
+                c = rev[(acc >> nbits) & 0x1F]
+                if c:
+                    out[pos] = c
+                    pos += 1
+        yield out[:pos]
+
+
+def decode(data):
+    # Text before the first stop word, or None if the data has no stop word
+    decoded = b"".join(decode_stream((data,)))
+    idx = decoded.find(STOP_WORD.encode("ascii"))
+    if idx < 0:
+        return None
+    return decoded[:idx].decode("ascii")
@@ -0,0 +1,42 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Optional native 5-bit pack/unpack loops for baudot_core.py.
+# Build next to it with:  cythonize -i baudot_kernel.pyx
+# baudot_core falls back to Numba / NumPy / pure Python when this is not built.
+
+
+def encode(const unsigned char[::1] codes):
+    # Pack 5-bit codes (already mapped through BAUDOT_LUT) MSB-first
+    cdef Py_ssize_t i, n = codes.shape[0], pos = 0
+    cdef unsigned int acc = 0, nbits = 0
+    out = bytearray((n * 5 + 7) // 8)
+    cdef unsigned char[::1] buf = out
+    for i in range(n):
+        acc = ((acc << 5) | codes[i]) & 0xFFF
+        nbits += 5
+        if nbits >= 8:
+            nbits -= 8
+            buf[pos] = (acc >> nbits) & 0xFF
+            pos += 1
+    if nbits:
+        buf[pos] = (acc << (8 - nbits)) & 0xFF
+        pos += 1
+    return bytes(out[:pos])
+
+
+def decode(const unsigned char[::1] data, const unsigned char[::1] rlut, unsigned int acc, unsigned int nbits):
+    # Unpack 5-bit codes through rlut, skipping codes that map to 0.
+    # (acc, nbits) is the bit window left over from the previous chunk.
+    cdef Py_ssize_t i, n = data.shape[0], pos = 0
+    cdef unsigned char c
+    out = bytearray((n * 8 + nbits) // 5)
+    cdef unsigned char[::1] buf = out
+    for i in range(n):
+        acc = ((acc << 8) | data[i]) & 0xFFF
+        nbits += 8
+        while nbits >= 5:
+            nbits -= 5
+            c = rlut[(acc >> nbits) & 0x1F]
+            if c:
+                buf[pos] = c
+                pos += 1
+    return bytes(out[:pos]), acc, nbits
@@ -0,0 +1,99 @@
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import baudot_core
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz 123"
+
+
+# The original string-based implementation every backend must match
+def reference_encode(message):
+    bitstring = "".join(baudot_core.BAUDOT_TABLE[char] for char in message + baudot_core.STOP_WORD)
+    bitstring += "0" * ((-len(bitstring)) % 8)
+    return bytes(int(bitstring[i:i+8], 2) for i in range(0, len(bitstring), 8))
+
+
+def reference_decode(data):
+    bitstring = "".join(f"{byte:08b}" for byte in data)
+    decoded = ""
+    for i in range(0, len(bitstring) - 4, 5):
+        decoded += baudot_core.REVERSE_TABLE.get(bitstring[i:i+5], "")
+    idx = decoded.find(baudot_core.STOP_WORD)
+    return decoded[:idx] if idx >= 0 else None
+
+
+def random_messages(rng, count=300):
+    for _ in range(count):
+        yield "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 80)))
+
+
+class BackendTests:
+    # Attributes of baudot_core set to None to force this backend
+    disabled = ()
+
+    def setUp(self):
+        for name in self.disabled:
+            patcher = mock.patch.object(baudot_core, name, None)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_encode_matches_reference(self):
+        rng = random.Random(1)
+        for message in random_messages(rng):
+            with self.subTest(message=message):
+                self.assertEqual(bytes(baudot_core.encode(message)), reference_encode(message))
+
+    def test_encode_rejects_invalid_characters(self):
+        for message in ("Hello", "tab\there", "café"):
+            with self.subTest(message=message):
+                with self.assertRaises(ValueError):
+                    baudot_core.encode(message)
+
+    def test_decode_matches_reference(self):
+        rng = random.Random(2)
+        for message in random_messages(rng):
+            data = reference_encode(message)
+            with self.subTest(message=message):
+                self.assertEqual(baudot_core.decode(data), reference_decode(data))
+        for _ in range(300):
+            data = bytes(rng.randrange(256) for _ in range(rng.randint(0, 60)))
+            with self.subTest(data=data):
+                self.assertEqual(baudot_core.decode(data), reference_decode(data))
+
+    def test_decode_stream_is_chunking_independent(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            data = bytes(rng.randrange(256) for _ in range(rng.randint(0, 80)))
+            whole = b"".join(baudot_core.decode_stream((data,)))
+            cuts = sorted(rng.randint(0, len(data)) for _ in range(rng.randint(0, 6)))
+            chunks = [data[a:b] for a, b in zip([0] + cuts, cuts + [len(data)])]
+            with self.subTest(data=data, cuts=cuts):
+                self.assertEqual(b"".join(baudot_core.decode_stream(chunks)), whole)
+
+
+class PurePythonBackendTest(BackendTests, unittest.TestCase):
+    disabled = ("baudot_kernel", "nb", "np")
+
+
+@unittest.skipIf(baudot_core.np is None, "numpy is not installed")
+class NumpyBackendTest(BackendTests, unittest.TestCase):
+    disabled = ("baudot_kernel", "nb")
+
+
+@unittest.skipIf(baudot_core.nb is None, "numba is not installed")
+class NumbaBackendTest(BackendTests, unittest.TestCase):
+    disabled = ("baudot_kernel",)
+
+
+@unittest.skipIf(baudot_core.baudot_kernel is None, "baudot_kernel is not built")
+class CythonBackendTest(BackendTests, unittest.TestCase):
+    disabled = ()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import contextlib
+import importlib.util
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import zlib
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_script():
+    # 1.53.py is not an importable module name and loads abv.txt from the cwd,
+    # writing its shortcut cache next to it; run it from a scratch copy so the
+    # checkout is left untouched
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copy(os.path.join(ROOT, "abv.txt"), tmp)
+        os.chdir(tmp)
+        try:
+            spec = importlib.util.spec_from_file_location("baudot_153", os.path.join(ROOT, "1.5", "1.53.py"))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        finally:
+            os.chdir(cwd)
+    return module
+
+
+class DecodeFromFileTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.script = load_script()
+
+    def decode_bytes(self, data):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "message.bin")
+            with open(filename, "wb") as f:
+                f.write(data)
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                self.script.decode_from_file(filename)
+        return out.getvalue()
+
+    def test_raw_file_with_zlib_looking_header(self):
+        # These encode to bytes starting 78da / 789c / 78bb, which pass the
+        # zlib header check but are not zlib streams
+        for message in ("kaf", "k1c", "k1xm"):
+            data = self.script.encode(message)
+            self.assertEqual(data[0], 0x78)
+            output = self.decode_bytes(data)
+            self.assertIn("Decoded message:\n", output)
+            self.assertEqual(output.split("Decoded message:\n", 1)[1].strip("\n"),
+                             self.script.apply_shortcuts_decode(message))
+
+    def test_zlib_compressed_file(self):
+        data = zlib.compress(self.script.encode("hello world"))
+        output = self.decode_bytes(data)
+        self.assertEqual(output.split("Decoded message:\n", 1)[1].strip("\n"),
+                         self.script.apply_shortcuts_decode("hello world"))
+
+    @unittest.skipIf(zstd is None, "zstandard is not installed")
+    def test_corrupt_zstd_file(self):
+        data = b"\x28\xb5\x2f\xfd\x00\x00" + b"\xff" * 16
+        self.assertEqual(self.decode_bytes(data), "Compressed data is corrupt.\n")
+
+    def test_raw_file_with_zstd_magic(self):
+        # Uncompressed output that happens to start with 28 b5 2f fd
+        message = "s1gl33d hello"
+        data = self.script.encode(message)
+        self.assertEqual(data[:4], b"\x28\xb5\x2f\xfd")
+        output = self.decode_bytes(data)
+        self.assertIn("Decoded message:\n", output)
+        self.assertEqual(output.split("Decoded message:\n", 1)[1].strip("\n"),
+                         self.script.apply_shortcuts_decode(message))
+
+
+if __name__ == "__main__":
+    unittest.main()